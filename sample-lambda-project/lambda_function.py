@@ -4,6 +4,8 @@ Sample Lambda function using test_common_framework and other dependencies.
 This file demonstrates how to use packages from the Lambda layer.
 """
 
+from typing import TypedDict
+
 # ============================================
 # Imports from test_common_framework (private GitHub repo)
 # ============================================
@@ -12,45 +14,89 @@ from test_common_framework.utils import (
     setup_logger,
     safe_json_loads,
     safe_json_dumps,
+    json_dumps_strict,
     retry,
-    get_nested_value,
+    make_path_getter,
     flatten_dict,
 )
 
 # ============================================
-# Imports from public packages (PyPI)
+# Imports from this project
 # ============================================
-import requests
-import watchtower
-import boto3
-from pydantic import BaseModel
-# import cv2  # opencv-python-headless - uncomment if needed
+from src.helpers import JSON_HEADERS
 
 # ============================================
-# Setup logging with CloudWatch integration
+# Cold-start init
+# Runs once per container, at import. Coding rule: nothing is imported or
+# constructed at module scope unless it is used on every invocation.
+# Heavy optional subsystems go through the lazy getters below instead.
 # ============================================
 import logging
 
 logger = setup_logger("my_lambda", level=logging.INFO)
 
-# Optional: Add CloudWatch handler for watchtower
-# cw_handler = watchtower.CloudWatchLogHandler(log_group="/aws/lambda/my-lambda")
-# logger.addHandler(cw_handler)
+# Accessors for fixed request body paths
+_get_user_id = make_path_getter("user.id", default="anonymous")
+_get_action = make_path_getter("request.action", default="unknown")
+
+# Invariant log line
+_START_MSG = f"Lambda started - test_common_framework version: {framework_version}"
 
+# 500 error body template; only "error" is filled in per request
+_ERROR_BODY = {"error": None, "message": "Internal server error"}
 
+
+# ============================================
+# Lazily initialized resources
+# Created on first use, then reused by warm invocations.
 # ============================================
-# Pydantic models for request/response validation
+_state = {"s3": None, "cw_handler": None, "executor": None}
+
+
+def get_s3_client():
+    """Return the shared boto3 S3 client, creating it on first call."""
+    if _state["s3"] is None:
+        import boto3
+        _state["s3"] = boto3.client("s3")
+    return _state["s3"]
+
+
+def enable_cloudwatch_logging(log_group: str = "/aws/lambda/my-lambda") -> None:
+    """
+    Attach a watchtower CloudWatch handler to the logger, once.
+
+    Requires watchtower, which is not in the PyPI layer by default;
+    add it to the pypi group in pyproject.toml before enabling.
+    """
+    if _state["cw_handler"] is None:
+        import watchtower
+        _state["cw_handler"] = watchtower.CloudWatchLogHandler(log_group=log_group)
+        logger.addHandler(_state["cw_handler"])
+
+
+def get_executor():
+    """Return the shared single-worker thread pool used to overlap I/O."""
+    if _state["executor"] is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _state["executor"] = ThreadPoolExecutor(max_workers=1)
+    return _state["executor"]
+
+
 # ============================================
-class UserRequest(BaseModel):
+# Request/response shapes
+# Plain TypedDicts: type hints only, no per-request validation cost.
+# Use pydantic (v2, in the PyPI layer) only where input validation is needed.
+# ============================================
+class UserRequest(TypedDict, total=False):
     user_id: str
     action: str
-    data: dict = {}
+    data: dict
 
 
-class LambdaResponse(BaseModel):
+class LambdaResponse(TypedDict):
     status_code: int
     message: str
-    data: dict = {}
+    data: dict
 
 
 # ============================================
@@ -59,6 +105,8 @@ class LambdaResponse(BaseModel):
 @retry(max_attempts=3, delay=1.0, backoff=2.0)
 def call_external_api(url: str) -> dict:
     """Call external API with automatic retry on failure."""
+    import requests
+
     response = requests.get(url, timeout=10)
     response.raise_for_status()
     return response.json()
@@ -67,18 +115,24 @@ def call_external_api(url: str) -> dict:
 def process_event_data(event: dict) -> dict:
     """Process incoming event using test_common_framework utilities."""
 
-    # Safely parse JSON body
-    body = event.get("body", "{}")
-    if isinstance(body, str):
+    # Safely parse JSON body. Already-parsed dicts (direct invokes, some
+    # integrations) pass through; bytes go to the parser without decoding.
+    # safe_json_loads rather than cached_json_loads: the body is returned
+    # to callers as raw_body, and a cached body would be shared between
+    # invocations.
+    body = event.get("body")
+    if isinstance(body, (str, bytes)):
         body = safe_json_loads(body, default={})
+    elif not isinstance(body, dict):
+        body = {}
 
     # Get nested values safely
-    user_id = get_nested_value(body, "user.id", default="anonymous")
-    action = get_nested_value(body, "request.action", default="unknown")
+    user_id = _get_user_id(body)
+    action = _get_action(body)
 
-    # Flatten nested data for logging
-    flat_data = flatten_dict(body)
-    logger.info(f"Flattened request data: {flat_data}")
+    # Flatten nested data for logging (skipped when INFO is disabled)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Flattened request data: %s", flatten_dict(body))
 
     return {
         "user_id": user_id,
@@ -87,6 +141,22 @@ def process_event_data(event: dict) -> dict:
     }
 
 
+def process_event_with_api(event: dict, url: str) -> tuple:
+    """
+    Process the event while the external API call is in flight.
+
+    The API call runs on a worker thread, which releases the GIL while
+    waiting on the network, so body parsing on this thread overlaps the
+    request round-trip instead of running before or after it.
+
+    Returns:
+        Tuple of (processed event data, API response data)
+    """
+    api_future = get_executor().submit(call_external_api, url)
+    processed = process_event_data(event)
+    return processed, api_future.result()
+
+
 # ============================================
 # Main Lambda handler
 # ============================================
@@ -101,48 +171,44 @@ def lambda_handler(event, context):
     Returns:
         dict: API Gateway compatible response
     """
-    logger.info(f"Lambda started - test_common_framework version: {framework_version}")
-    logger.info(f"Event: {safe_json_dumps(event)}")
+    logger.info(_START_MSG)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Event: %s", safe_json_dumps(event))
 
     try:
         # Process the incoming event
         processed = process_event_data(event)
+        # To also call an external API, overlap it with event processing:
+        # processed, api_data = process_event_with_api(
+        #     event, "https://api.example.com/data"
+        # )
 
-        logger.info(f"Processing request for user: {processed['user_id']}")
-        logger.info(f"Action: {processed['action']}")
-
-        # Example: Call external API with retry
-        # api_data = call_external_api("https://api.example.com/data")
+        logger.info("Processing request for user: %s", processed["user_id"])
+        logger.info("Action: %s", processed["action"])
 
         # Build response
-        response = LambdaResponse(
-            status_code=200,
-            message="Request processed successfully",
-            data={
+        response: LambdaResponse = {
+            "status_code": 200,
+            "message": "Request processed successfully",
+            "data": {
                 "user_id": processed["user_id"],
                 "action": processed["action"],
                 "framework_version": framework_version,
-            }
-        )
+            },
+        }
 
         return {
-            "statusCode": response.status_code,
-            "headers": {
-                "Content-Type": "application/json",
-            },
-            "body": safe_json_dumps(response.model_dump()),
+            "statusCode": response["status_code"],
+            "headers": JSON_HEADERS,
+            # Known JSON-native types: skip the fallback serializer hook
+            "body": json_dumps_strict(response),
         }
 
     except Exception as e:
-        logger.error(f"Error processing request: {str(e)}")
+        logger.error("Error processing request: %s", e)
 
         return {
             "statusCode": 500,
-            "headers": {
-                "Content-Type": "application/json",
-            },
-            "body": safe_json_dumps({
-                "error": str(e),
-                "message": "Internal server error",
-            }),
+            "headers": JSON_HEADERS,
+            "body": safe_json_dumps({**_ERROR_BODY, "error": str(e)}),
         }
@@ -2,16 +2,32 @@
 Helper functions for the Lambda project.
 """
 
-from test_common_framework.utils import get_nested_value, safe_json_dumps
+from test_common_framework.utils import make_path_getter, safe_json_dumps
+
+# Response headers shared by every response built in this project.
+# API Gateway only reads them, so one dict is reused instead of rebuilt.
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Accessors for fixed event paths, built once at import
+_get_user_id = make_path_getter(
+    "requestContext.authorizer.claims.sub", default="anonymous"
+)
+_get_email = make_path_getter(
+    "requestContext.authorizer.claims.email", default=""
+)
 
 
 def format_response(status_code: int, body: dict) -> dict:
-    """Format a standard API Gateway response."""
+    """
+    Format a standard API Gateway response.
+
+    The returned "headers" is the shared JSON_HEADERS dict. To add headers
+    (e.g. CORS), replace it with a new dict rather than mutating it:
+    response["headers"] = {**response["headers"], "Access-Control-Allow-Origin": "*"}
+    """
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-        },
+        "headers": JSON_HEADERS,
         "body": safe_json_dumps(body),
     }
 
@@ -19,6 +35,6 @@ def format_response(status_code: int, body: dict) -> dict:
 def extract_user_info(event: dict) -> dict:
     """Extract user information from the event."""
     return {
-        "user_id": get_nested_value(event, "requestContext.authorizer.claims.sub", default="anonymous"),
-        "email": get_nested_value(event, "requestContext.authorizer.claims.email", default=""),
+        "user_id": _get_user_id(event),
+        "email": _get_email(event),
     }
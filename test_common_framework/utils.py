@@ -6,10 +6,73 @@ Add your common utility functions here.
 
 import json
 import logging
-from typing import Any, Dict, Optional
-from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+from functools import lru_cache, wraps
+from itertools import islice
 import time
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize nested pydantic v2 models via model_dump, anything else via str."""
+    model_dump = getattr(obj, "model_dump", None)
+    if model_dump is not None:
+        return model_dump(mode="json")
+    return str(obj)
+
+
+# JSON backend: orjson (C extension) when installed, stdlib json otherwise
+if orjson is not None:
+    def _loads(json_string: Any) -> Any:
+        try:
+            return orjson.loads(json_string)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity literals and lone surrogates, which stdlib
+            # json accepts
+            return json.loads(json_string)
+
+    # Match stdlib json's strict behavior: accept non-str keys, reject
+    # datetimes and dataclasses rather than serializing them natively
+    _STRICT_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def _dumps_strict(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=_STRICT_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            # Let stdlib json decide on inputs orjson rejects (e.g. integers
+            # above 64 bits), so both backends accept and reject the same data
+            return json.dumps(obj)
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(
+                obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers above 64 bits, which stdlib json supports
+            return json.dumps(obj, default=_json_default)
+else:
+    _loads = json.loads
+    _dumps_strict = json.dumps
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=_json_default)
+
+
+# Sentinel for missing dictionary keys
+_MISS = object()
+
+# Fully configured loggers, keyed by (name, level, format_string)
+_LOGGER_CACHE: Dict[tuple, logging.Logger] = {}
+
 
 def setup_logger(
     name: str,
@@ -19,6 +82,12 @@ def setup_logger(
     """
     Set up a logger with consistent formatting.
 
+    Loggers are cached, so repeated calls with the same arguments return
+    the already configured instance (with the level re-applied). A cached
+    logger whose handlers were removed is configured again. Propagation
+    to the root logger is disabled to avoid emitting each record twice
+    (e.g. in AWS Lambda, where the root logger already has a handler).
+
     Args:
         name: Logger name
         level: Logging level (default: INFO)
@@ -27,8 +96,15 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
+    key = (name, level, format_string)
+    cached = _LOGGER_CACHE.get(key)
+    if cached is not None and cached.handlers:
+        cached.setLevel(level)
+        return cached
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    logger.propagate = False
 
     if not logger.handlers:
         handler = logging.StreamHandler()
@@ -41,6 +117,7 @@ def setup_logger(
         handler.setFormatter(formatter)
         logger.addHandler(handler)
 
+    _LOGGER_CACHE[key] = logger
     return logger
 
 
@@ -48,16 +125,59 @@ def safe_json_loads(json_string: str, default: Any = None) -> Any:
     """
     Safely parse JSON string, returning default on failure.
 
+    Uses orjson when installed, falling back to stdlib json for input
+    orjson rejects (NaN/Infinity literals, lone surrogates). Note that
+    orjson parses integers outside the 64-bit range as floats, losing
+    precision, where stdlib json keeps them exact.
+
+    Args:
+        json_string: JSON string (or bytes) to parse
+        default: Value to return if parsing fails
+
+    Returns:
+        Parsed JSON object or default value
+    """
+    try:
+        return _loads(json_string)
+    except (ValueError, TypeError):
+        return default
+
+
+# Inputs longer than this are parsed directly rather than cached
+_JSON_CACHE_MAX_LENGTH = 16384
+
+
+@lru_cache(maxsize=128)
+def _cached_loads(json_string: Any) -> Any:
+    return _loads(json_string)
+
+
+def cached_json_loads(json_string: Any, default: Any = None) -> Any:
+    """
+    Safely parse JSON, caching results for recently seen inputs.
+
+    Useful when the same payload is delivered repeatedly, e.g. retried
+    events in a warm Lambda container. Only str/bytes inputs up to 16 KiB
+    are cached; larger ones are parsed directly.
+
+    The returned object is shared between calls with the same input, so
+    callers must not mutate it. Use safe_json_loads if they might.
+
     Args:
-        json_string: JSON string to parse
+        json_string: JSON string (or bytes) to parse
         default: Value to return if parsing fails
 
     Returns:
         Parsed JSON object or default value
     """
     try:
-        return json.loads(json_string)
-    except (json.JSONDecodeError, TypeError):
+        if (
+            isinstance(json_string, (str, bytes))
+            and len(json_string) <= _JSON_CACHE_MAX_LENGTH
+        ):
+            return _cached_loads(json_string)
+        return _loads(json_string)
+    except (ValueError, TypeError):
         return default
 
 
@@ -65,6 +185,12 @@ def safe_json_dumps(obj: Any, default: str = "{}") -> str:
     """
     Safely serialize object to JSON string.
 
+    Uses orjson when installed, producing compact output without spaces,
+    ISO 8601 datetimes (with "T") and null for NaN/Infinity. Inputs orjson
+    rejects, such as integers above 64 bits, fall back to stdlib json.
+    pydantic v2 models are serialized in a single pass with model_dump_json,
+    skipping the intermediate dict.
+
     Args:
         obj: Object to serialize
         default: Value to return if serialization fails
@@ -73,11 +199,39 @@ def safe_json_dumps(obj: Any, default: str = "{}") -> str:
         JSON string or default value
     """
     try:
-        return json.dumps(obj, default=str)
+        if type(obj) is not dict:
+            model_dump_json = getattr(obj, "model_dump_json", None)
+            if model_dump_json is not None:
+                return model_dump_json()
+        return _dumps(obj)
     except (TypeError, ValueError):
         return default
 
 
+def json_dumps_strict(obj: Any) -> str:
+    """
+    Serialize JSON-native data (dict, list, str, int, float, bool, None).
+
+    Faster than safe_json_dumps since no fallback hook is installed, but
+    raises TypeError for other types such as datetime, date, Decimal,
+    sets and dataclasses. Non-str keys (int, float, bool, None) are
+    accepted and converted to strings, as in stdlib json. Use it only
+    where the input is known to be JSON-native, e.g. response bodies
+    built from literals.
+
+    Backend differences: on orjson, UUID and Enum values are also
+    accepted, and NaN/Infinity serialize as null; stdlib json writes
+    them as the non-standard NaN/Infinity literals.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON string
+    """
+    return _dumps_strict(obj)
+
+
 def retry(
     max_attempts: int = 3,
     delay: float = 1.0,
@@ -97,19 +251,24 @@ def retry(
         Decorated function
     """
     def decorator(func):
+        sleep = time.sleep
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            current_delay = delay
-            last_exception = None
+            # Fast path: first attempt without loop setup
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                last_exception = e
 
-            for attempt in range(max_attempts):
+            current_delay = delay
+            for _ in range(max_attempts - 1):
+                sleep(current_delay)
+                current_delay *= backoff
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-                    if attempt < max_attempts - 1:
-                        time.sleep(current_delay)
-                        current_delay *= backoff
 
             raise last_exception
 
@@ -125,22 +284,42 @@ def flatten_dict(
     """
     Flatten a nested dictionary.
 
+    Walks the dictionary iteratively with an explicit stack, writing
+    directly into a single result dict. Key order matches a depth-first
+    traversal of the input. Flat input is returned as a shallow copy.
+
     Args:
         d: Dictionary to flatten
-        parent_key: Prefix for keys (used in recursion)
+        parent_key: Prefix for all keys
         separator: Separator between nested keys
 
     Returns:
-        Flattened dictionary
+        Flattened dictionary (empty if d is not a dictionary)
     """
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{separator}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, separator).items())
+    if not isinstance(d, dict):
+        return {}
+
+    # Fast path: nothing nested, no prefix to apply
+    if not parent_key:
+        for v in d.values():
+            if isinstance(v, dict):
+                break
+        else:
+            return dict(d)
+
+    out = {}
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{separator}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((new_key, iter(v.items())))
+                break
+            out[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return out
 
 
 def get_nested_value(
@@ -161,18 +340,74 @@ def get_nested_value(
     Returns:
         Value at the path or default
     """
-    keys = key_path.split(separator)
     result = d
+    dict_type = dict
 
-    for key in keys:
-        if isinstance(result, dict) and key in result:
-            result = result[key]
-        else:
+    for key in _split_path(key_path, separator):
+        # Exact-type identity check first; isinstance only for dict subclasses
+        if type(result) is not dict_type and not isinstance(result, dict_type):
+            return default
+        result = result.get(key, _MISS)
+        if result is _MISS:
             return default
 
     return result
 
 
+def make_path_getter(
+    key_path: str,
+    default: Any = None,
+    separator: str = "."
+) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Build a reusable accessor for a fixed nested key path.
+
+    Equivalent to get_nested_value, for call sites whose key path is a
+    constant. The accessor is generated as straight-line code with one
+    lookup step per key, so calls run no loop and no path splitting.
+
+    Args:
+        key_path: Path to the value (e.g., "level1.level2.key")
+        default: Value the accessor returns if the path is not found
+        separator: Separator used in key_path
+
+    Returns:
+        Function taking a dictionary and returning the value at the path
+    """
+    keys = key_path.split(separator)
+
+    # Keys are passed to a generated factory and bound as closure variables
+    # (_k0, _k1, ...), never embedded in the source, so any key text is safe.
+    # The accessor takes only d, so extra arguments raise TypeError.
+    step = (
+        "        if type(r) is not _dict and not isinstance(r, _dict):\n"
+        "            return _default\n"
+        "        r = r.get(_k{i}, _miss)\n"
+        "        if r is _miss:\n"
+        "            return _default\n"
+    )
+    params = "".join(f", _k{i}" for i in range(len(keys)))
+    source = (
+        f"def factory(_default, _dict, _miss{params}):\n"
+        "    def getter(d):\n"
+        "        r = d\n"
+        + "".join(step.format(i=i) for i in range(len(keys)))
+        + "        return r\n"
+        "    return getter\n"
+    )
+
+    namespace = {}
+    exec(source, namespace)
+
+    return namespace["factory"](default, dict, _MISS, *keys)
+
+
+@lru_cache(maxsize=256)
+def _split_path(key_path: str, separator: str) -> tuple:
+    """Split a key path into its keys, cached for repeated literal paths."""
+    return tuple(key_path.split(separator))
+
+
 def chunk_list(lst: list, chunk_size: int) -> list:
     """
     Split a list into chunks of specified size.
@@ -185,3 +420,57 @@ def chunk_list(lst: list, chunk_size: int) -> list:
         List of chunks
     """
     return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+
+
+def iter_chunks(iterable: Iterable, chunk_size: int) -> Iterator[list]:
+    """
+    Lazily yield chunks of specified size from any iterable.
+
+    Memory-efficient alternative to chunk_list when the chunks are only
+    iterated once, or when the input is itself a generator.
+
+    Args:
+        iterable: Iterable to split
+        chunk_size: Size of each chunk
+
+    Returns:
+        Iterator over lists of up to chunk_size items
+
+    Raises:
+        ValueError: If chunk_size is less than 1
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    return _iter_chunks(iter(iterable), chunk_size)
+
+
+def _iter_chunks(it: Iterator, chunk_size: int) -> Iterator[list]:
+    while chunk := list(islice(it, chunk_size)):
+        yield chunk
+
+
+def chunk_array(arr: Any, chunk_size: int) -> list:
+    """
+    Split a numpy array into chunks of specified size without copying.
+
+    Requires numpy to be installed. Like chunk_list, an empty array
+    yields an empty list.
+
+    Args:
+        arr: numpy array (or array-like) to split along its first axis
+        chunk_size: Size of each chunk
+
+    Returns:
+        List of array views
+
+    Raises:
+        ValueError: If chunk_size is less than 1
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if len(arr) == 0:
+        return []
+
+    import numpy as np
+
+    return np.split(arr, range(chunk_size, len(arr), chunk_size))
@@ -13,6 +13,7 @@ VERSION_MAJOR = 0
 VERSION_MINOR = 5
 VERSION_PATCH = 6
 VERSION_SUFFIX = ""  # e.g., "dev.1", "alpha.1", "rc.1" for non-main branches
+_VERSION_TUPLE = (VERSION_MAJOR, VERSION_MINOR, VERSION_PATCH, VERSION_SUFFIX)
 
 
 def get_version() -> str:
@@ -22,4 +23,4 @@ def get_version() -> str:
 
 def get_version_tuple() -> tuple:
     """Return version as a tuple (major, minor, patch, suffix)."""
-    return (VERSION_MAJOR, VERSION_MINOR, VERSION_PATCH, VERSION_SUFFIX)
+    return _VERSION_TUPLE
@@ -1,5 +1,12 @@
 """Tests for utility functions."""
 
+import dataclasses
+import datetime
+import json
+import logging
+import math
+from collections import OrderedDict
+
 import pytest
 from test_common_framework import __version__, utils
 
@@ -10,15 +17,123 @@ def test_version():
     assert isinstance(__version__, str)
 
 
+def test_setup_logger():
+    """Test logger setup is cached and does not propagate."""
+    logger = utils.setup_logger("test_setup_logger")
+    assert utils.setup_logger("test_setup_logger") is logger
+    assert len(logger.handlers) == 1
+    assert logger.propagate is False
+
+
+def test_setup_logger_level_changes():
+    """Test repeated setup calls re-apply the requested level."""
+    logger = utils.setup_logger("test_setup_logger_levels", level=logging.INFO)
+    utils.setup_logger("test_setup_logger_levels", level=logging.DEBUG)
+    assert logger.level == logging.DEBUG
+    utils.setup_logger("test_setup_logger_levels", level=logging.INFO)
+    assert logger.level == logging.INFO
+
+
+def test_setup_logger_handlers_cleared():
+    """Test a cached logger whose handlers were removed is reconfigured."""
+    logger = utils.setup_logger("test_setup_logger_cleared")
+    logger.handlers.clear()
+    assert utils.setup_logger("test_setup_logger_cleared") is logger
+    assert len(logger.handlers) == 1
+
+
 def test_safe_json_loads():
     """Test safe JSON parsing."""
     assert utils.safe_json_loads('{"key": "value"}') == {"key": "value"}
     assert utils.safe_json_loads('invalid json', default={}) == {}
+    assert utils.safe_json_loads(b'{"key": "value"}') == {"key": "value"}
+    assert utils.safe_json_loads(None, default={}) == {}
+    assert math.isinf(utils.safe_json_loads('{"n": Infinity}')["n"])
+    assert math.isnan(utils.safe_json_loads('{"n": NaN}')["n"])
+    assert utils.safe_json_loads('["\\ud800"]') == ["\ud800"]
+
+
+def test_cached_json_loads():
+    """Test cached JSON parsing returns the shared parsed object."""
+    first = utils.cached_json_loads('{"cached": true}')
+    assert first == {"cached": True}
+    assert utils.cached_json_loads('{"cached": true}') is first
+    assert utils.cached_json_loads('invalid json', default={}) == {}
+    assert utils.cached_json_loads(None, default={}) == {}
+    assert utils.cached_json_loads(bytearray(b'[1]')) == [1]
+
+    large = '{"k": "' + "x" * utils._JSON_CACHE_MAX_LENGTH + '"}'
+    assert utils.cached_json_loads(large) is not utils.cached_json_loads(large)
 
 
 def test_safe_json_dumps():
     """Test safe JSON serialization."""
-    assert utils.safe_json_dumps({"key": "value"}) == '{"key": "value"}'
+    assert json.loads(utils.safe_json_dumps({"key": "value"})) == {"key": "value"}
+    assert json.loads(utils.safe_json_dumps({1: "one"})) == {"1": "one"}
+    assert json.loads(utils.safe_json_dumps({"n": 2**70})) == {"n": 2**70}
+
+
+def test_json_dumps_strict():
+    """Test strict serialization of JSON-native data."""
+    assert json.loads(utils.json_dumps_strict({"key": [1, None]})) == {"key": [1, None]}
+    assert json.loads(utils.json_dumps_strict({1: 2**70})) == {"1": 2**70}
+
+    nan_json = utils.json_dumps_strict({"x": float("nan")})
+    if utils.orjson is not None:
+        assert nan_json == '{"x":null}'
+    else:
+        assert nan_json == '{"x": NaN}'
+
+    @dataclasses.dataclass
+    class Point:
+        x: int
+
+    for value in (
+        object(),
+        datetime.date(2024, 1, 1),
+        datetime.datetime(2024, 1, 1),
+        Point(1),
+    ):
+        with pytest.raises(TypeError):
+            utils.json_dumps_strict({"key": value})
+
+
+def test_safe_json_dumps_model():
+    """Test pydantic-style models are serialized via their own dump methods."""
+    class Model:
+        def model_dump(self, mode="python"):
+            return {"key": "value"}
+
+        def model_dump_json(self):
+            return '{"key":"value"}'
+
+    assert utils.safe_json_dumps(Model()) == '{"key":"value"}'
+    assert json.loads(utils.safe_json_dumps({"m": Model()})) == {"m": {"key": "value"}}
+
+
+def test_retry():
+    """Test retry decorator retries then re-raises the last exception."""
+    calls = []
+
+    @utils.retry(max_attempts=3, delay=0, exceptions=(ValueError,))
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ValueError(len(calls))
+        return "ok"
+
+    assert flaky() == "ok"
+    assert len(calls) == 3
+
+    @utils.retry(max_attempts=2, delay=0, exceptions=(ValueError,))
+    def always_fails():
+        calls.append(1)
+        raise ValueError(len(calls))
+
+    calls.clear()
+    with pytest.raises(ValueError, match="2"):
+        always_fails()
+    assert len(calls) == 2
 
 
 def test_flatten_dict():
@@ -26,15 +141,64 @@ def test_flatten_dict():
     nested = {"a": {"b": {"c": 1}}}
     assert utils.flatten_dict(nested) == {"a.b.c": 1}
 
+    mixed = {"x": 1, "a": {"b": 2, "c": {"d": 3}}, "y": 4}
+    assert list(utils.flatten_dict(mixed).items()) == [
+        ("x", 1), ("a.b", 2), ("a.c.d", 3), ("y", 4)
+    ]
+    assert utils.flatten_dict({"a": {"b": 1}}, parent_key="p") == {"p.a.b": 1}
+    assert utils.flatten_dict(None) == {}
+
+    flat = {"a": 1, "b": [2]}
+    result = utils.flatten_dict(flat)
+    assert result == flat
+    assert result is not flat
+
 
 def test_get_nested_value():
     """Test nested value retrieval."""
     d = {"level1": {"level2": {"key": "value"}}}
     assert utils.get_nested_value(d, "level1.level2.key") == "value"
     assert utils.get_nested_value(d, "nonexistent", default="default") == "default"
+    assert utils.get_nested_value(d, "level1.level2.key.deeper") is None
+    assert utils.get_nested_value({"a": None}, "a", default="x") is None
+    assert utils.get_nested_value(OrderedDict(a={"b": 1}), "a.b") == 1
+
+
+def test_make_path_getter():
+    """Test accessor built for a fixed key path."""
+    get_key = utils.make_path_getter("level1.level2.key", default="default")
+    assert get_key({"level1": {"level2": {"key": "value"}}}) == "value"
+    assert get_key({"level1": {}}) == "default"
+    assert get_key({"level1": "not a dict"}) == "default"
+    assert get_key(None) == "default"
+    with pytest.raises(TypeError):
+        get_key({}, "fallback")
+
+    get_odd = utils.make_path_getter('a"b.c\\nd')
+    assert get_odd({'a"b': {"c\\nd": 1}}) == 1
 
 
 def test_chunk_list():
     """Test list chunking."""
     lst = [1, 2, 3, 4, 5]
     assert utils.chunk_list(lst, 2) == [[1, 2], [3, 4], [5]]
+
+
+def test_iter_chunks():
+    """Test lazy chunking of an iterable."""
+    assert list(utils.iter_chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(utils.iter_chunks([], 2)) == []
+    with pytest.raises(ValueError):
+        utils.iter_chunks(range(5), 0)
+
+
+def test_chunk_array():
+    """Test numpy array chunking returns views."""
+    np = pytest.importorskip("numpy")
+    arr = np.arange(5)
+    chunks = utils.chunk_array(arr, 2)
+    assert [c.tolist() for c in chunks] == [[0, 1], [2, 3], [4]]
+    assert all(np.shares_memory(c, arr) for c in chunks)
+    assert utils.chunk_array(np.arange(0), 2) == []
+    with pytest.raises(ValueError):
+        utils.chunk_array(arr, 0)